@@ -7,19 +7,32 @@ This script converts formatted text scripts into podcasts with voices and sound
 It rotates between multiple ElevenLabs API keys and tracks credit usage.
 """
 
+import io
 import os
+import bisect
 import json
 import time
+import atexit
+import tempfile
+import hashlib
 import logging
+import threading
 import requests
-import random
+import numpy as np
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pydub import AudioSegment
-from pydub.effects import normalize
 from dotenv import load_dotenv
 from tqdm import tqdm
 import re
 
+# Optional JIT for the sound effect overlay kernel
+try:
+    import numba
+except ImportError:
+    numba = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -40,8 +53,55 @@ VOICES_API_URL = "https://api.elevenlabs.io/v1/voices"
 USAGE_API_URL = "https://api.elevenlabs.io/v1/user/subscription"
 OUTPUT_DIR = "output"
 SFX_DIR = "sfx"
+CACHE_DIR = "cache"
+CACHE_MAX_BYTES = 500 * 1024 * 1024  # 500 MB of cached speech
 CREDITS_LOG_FILE = "credits_log.json"
 
+# Podcast mix format (ElevenLabs returns 44.1 kHz mono speech)
+TARGET_FRAME_RATE = 44100
+TARGET_CHANNELS = 1
+SAMPLE_WIDTH = 2  # 16-bit samples
+
+# ffmpeg options for the final MP3: LAME VBR quality 4 (ample for speech)
+EXPORT_PARAMETERS = ["-q:a", "4", "-ac", str(TARGET_CHANNELS)]
+
+# Speech synthesis settings
+MODEL_ID = "eleven_monolingual_v1"
+# pcm_44100 returns raw samples that need no decoding, but requires a Pro plan
+OUTPUT_FORMAT = os.getenv("ELEVENLABS_OUTPUT_FORMAT", "mp3_44100_128")
+VOICE_SETTINGS = {
+    "stability": 0.5,
+    "similarity_boost": 0.75
+}
+
+# Script tags: [SPEAKER: name] and [SFX: effect]
+_TAG_RE = re.compile(r'\[(SPEAKER|SFX):\s*([^\]]+)\]')
+
+
+def _overlay_numpy(dst, src, offset):
+    """Add src into dst at offset in place, saturating at the int16 range."""
+    end = offset + len(src)
+    np.clip(
+        dst[offset:end].astype(np.int32) + src,
+        -32768, 32767, out=dst[offset:end], casting="unsafe"
+    )
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _overlay(dst, src, offset):
+        """Add src into dst at offset in place, saturating at the int16 range."""
+        for i in range(src.shape[0]):
+            v = np.int32(dst[offset + i]) + np.int32(src[i])
+            if v > 32767:
+                v = 32767
+            elif v < -32768:
+                v = -32768
+            dst[offset + i] = v
+else:
+    _overlay = _overlay_numpy
+
+
 # Voice IDs mapping (can be customized)
 DEFAULT_VOICE_MAPPING = {
     "Bhaskar": "ErXwobaYiN019PkySvjV",  # Antoni (deep authoritative male)
@@ -67,10 +127,36 @@ class ApiKeyManager:
         self.current_index = 0
         self.credits_log = self._load_credits_log()
         
+        # Guards key rotation and the credits log under concurrent synthesis
+        self._lock = threading.Lock()
+        
+        # Credit usage is buffered in memory and written out by flush()
+        self._dirty = False
+        atexit.register(self.flush)
+        
         if not self.api_keys:
             logger.error("No API keys found. Please provide at least one API key.")
             raise ValueError("No API keys provided")
         
+        # Each key is an independent rate-limit bucket, so concurrency scales with keys
+        self.max_concurrency = max(4, 2 * len(self.api_keys))
+        
+        # Shared session so keep-alive reuses TLS connections across requests.
+        # All keys hit the same host, so one pool serves them all; the
+        # xi-api-key header still varies per request. The pool holds one
+        # connection per concurrent request and blocks rather than opening
+        # throwaway connections beyond that.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=len(self.api_keys),
+            pool_maxsize=self.max_concurrency,
+            pool_block=True
+        )
+        self.session.mount("https://", adapter)
+        
+        # Remaining budget per key, fetched once and then tracked locally
+        self.budgets = self._load_budgets()
+        
         logger.info(f"Initialized with {len(self.api_keys)} API keys")
     
     def _load_credits_log(self):
@@ -89,27 +175,63 @@ class ApiKeyManager:
         """Save credits log to file."""
         with open(CREDITS_LOG_FILE, 'w') as f:
             json.dump(self.credits_log, f, indent=2)
+    
+    def flush(self):
+        """Write buffered credit usage to the credits log file."""
+        with self._lock:
+            if self._dirty:
+                self._save_credits_log()
+                self._dirty = False
+    
+    def _load_budgets(self):
+        """Fetch [used, limit] character counts for every key in parallel."""
+        with ThreadPoolExecutor(max_workers=len(self.api_keys)) as executor:
+            usage = list(executor.map(self.get_remaining_credits, self.api_keys))
+        
+        budgets = {}
+        for api_key, (used, limit) in zip(self.api_keys, usage):
+            if used is not None and limit:
+                budgets[api_key] = [used, limit]
+            else:
+                logger.warning(f"Unknown credit budget for API key {api_key[:8]}..., using rotation only")
+        
+        return budgets
         
-    def get_next_api_key(self):
-        """Get the next API key in rotation."""
-        api_key = self.api_keys[self.current_index]
-        # Update index for next call
-        self.current_index = (self.current_index + 1) % len(self.api_keys)
+    def get_next_api_key(self, char_count=0):
+        """Get the least used API key that can cover char_count, or the next in rotation."""
+        with self._lock:
+            candidates = [
+                key for key, (used, limit) in self.budgets.items()
+                if limit - used >= char_count
+            ]
+            
+            if candidates:
+                api_key = min(candidates, key=lambda k: self.budgets[k][0] / self.budgets[k][1])
+                # Charge the budget now so concurrent requests spread across keys
+                self.budgets[api_key][0] += char_count
+            else:
+                # Fall back to rotation, preferring keys whose budget is unknown
+                rotation = [key for key in self.api_keys if key not in self.budgets]
+                rotation = rotation or self.api_keys
+                api_key = rotation[self.current_index % len(rotation)]
+                # Update index for next call
+                self.current_index = (self.current_index + 1) % len(rotation)
         return api_key
     
     def log_credit_usage(self, api_key, character_count, credits_used):
         """Log credit usage for a specific API key."""
         key_id = api_key[:8] + '...'
-        if key_id not in self.credits_log:
-            self.credits_log[key_id] = []
-        
-        self.credits_log[key_id].append({
-            "timestamp": datetime.now().isoformat(),
-            "character_count": character_count,
-            "credits_used": credits_used
-        })
-        
-        self._save_credits_log()
+        with self._lock:
+            if key_id not in self.credits_log:
+                self.credits_log[key_id] = []
+            
+            self.credits_log[key_id].append({
+                "timestamp": datetime.now().isoformat(),
+                "character_count": character_count,
+                "credits_used": credits_used
+            })
+            
+            self._dirty = True
         logger.info(f"Logged {credits_used} credits used for API key {key_id}")
     
     def get_remaining_credits(self, api_key):
@@ -117,7 +239,7 @@ class ApiKeyManager:
         headers = {"xi-api-key": api_key}
         
         try:
-            response = requests.get(USAGE_API_URL, headers=headers)
+            response = self.session.get(USAGE_API_URL, headers=headers)
             if response.status_code == 200:
                 data = response.json()
                 return data.get("character_count", 0), data.get("character_limit", 0)
@@ -138,79 +260,222 @@ class ScriptParser:
         
     def parse(self):
         """Parse the script into a list of chunks (dialogue or SFX)."""
-        chunks = []
+        return list(self.iter_chunks())
+    
+    def iter_chunks(self):
+        """Parse the script lazily, yielding chunks (dialogue or SFX) as they are read."""
         current_speaker = "Default"
         
         try:
             with open(self.script_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            buffer = []
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
+                buffer = []
                 
-                # Check for speaker tag
-                speaker_match = re.match(r'\[SPEAKER:\s*([^\]]+)\]', line)
-                if speaker_match:
-                    # If there's text in buffer, add it as a chunk with previous speaker
-                    if buffer:
-                        chunks.append({
-                            "type": "dialogue",
-                            "speaker": current_speaker,
-                            "text": " ".join(buffer)
-                        })
-                        buffer = []
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
                     
-                    current_speaker = speaker_match.group(1).strip()
-                    continue
-                
-                # Check for SFX tag
-                sfx_match = re.match(r'\[SFX:\s*([^\]]+)\]', line)
-                if sfx_match:
-                    # If there's text in buffer, add it as a chunk
-                    if buffer:
-                        chunks.append({
-                            "type": "dialogue",
-                            "speaker": current_speaker,
-                            "text": " ".join(buffer)
-                        })
-                        buffer = []
+                    # Check for speaker or SFX tag
+                    tag_match = _TAG_RE.match(line)
+                    if tag_match:
+                        # If there's text in buffer, yield it as a chunk with previous speaker
+                        if buffer:
+                            yield {
+                                "type": "dialogue",
+                                "speaker": current_speaker,
+                                "text": " ".join(buffer)
+                            }
+                            buffer = []
+                        
+                        tag, value = tag_match.group(1), tag_match.group(2).strip()
+                        if tag == "SPEAKER":
+                            current_speaker = value
+                        else:
+                            # Yield the SFX as a chunk
+                            yield {
+                                "type": "sfx",
+                                "effect": value
+                            }
+                        continue
                     
-                    # Add the SFX as a chunk
-                    chunks.append({
-                        "type": "sfx",
-                        "effect": sfx_match.group(1).strip()
-                    })
-                    continue
+                    # If it's a regular line, add to buffer
+                    buffer.append(line)
                 
-                # If it's a regular line, add to buffer
-                buffer.append(line)
-            
-            # Add any remaining text in buffer
-            if buffer:
-                chunks.append({
-                    "type": "dialogue",
-                    "speaker": current_speaker,
-                    "text": " ".join(buffer)
-                })
-            
-            return chunks
+                # Yield any remaining text in buffer
+                if buffer:
+                    yield {
+                        "type": "dialogue",
+                        "speaker": current_speaker,
+                        "text": " ".join(buffer)
+                    }
         
         except Exception as e:
             logger.error(f"Error parsing script: {str(e)}")
             raise
 
+class TTSCache:
+    """Content-addressed on-disk cache for synthesized speech with LRU eviction."""
+    
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        """Initialize with path to cache directory and maximum cache size in bytes."""
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.manifest_file = os.path.join(self.cache_dir, "manifest.json")
+        
+        # Create cache directory if it doesn't exist
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+            logger.info(f"Created directory: {self.cache_dir}")
+        
+        # Manifest maps entry hash to last access time and size for eviction.
+        # Accesses are recorded in memory and written out by put() or flush()
+        self.manifest = self._load_manifest()
+        self._lock = threading.Lock()
+        self._dirty = False
+        atexit.register(self.flush)
+    
+    def _load_manifest(self):
+        """Load cache manifest from file or create a new one."""
+        if os.path.exists(self.manifest_file):
+            try:
+                with open(self.manifest_file, 'r') as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                logger.warning(f"Error reading {self.manifest_file}, creating new manifest")
+        
+        return {}
+    
+    def _save_manifest(self):
+        """Save cache manifest to file."""
+        # Write to a temp file and swap it in so a crash never leaves a truncated manifest
+        temp_file = self.manifest_file + ".tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(temp_file, self.manifest_file)
+        self._dirty = False
+    
+    def flush(self):
+        """Write recorded cache accesses to the manifest file."""
+        with self._lock:
+            if self._dirty:
+                self._save_manifest()
+    
+    def _hash(self, key_tuple):
+        """Hash a (voice_id, model_id, voice_settings, output_format, text) tuple."""
+        voice_id, model_id, voice_settings, output_format, text = key_tuple
+        key = json.dumps(
+            {"v": voice_id, "m": model_id, "s": voice_settings, "t": text, "f": output_format},
+            sort_keys=True
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+    
+    def _path(self, entry_hash, output_format):
+        """Get the file path for a cache entry, named after its audio format."""
+        return os.path.join(self.cache_dir, f"{entry_hash}.{output_format.split('_')[0]}")
+    
+    def _remove(self, entry_hash, output_format):
+        """Remove a cache entry from disk and from the manifest."""
+        self.manifest.pop(entry_hash, None)
+        path = self._path(entry_hash, output_format)
+        if os.path.exists(path):
+            os.remove(path)
+    
+    def _evict(self):
+        """Evict least recently used entries until the cache fits its size cap."""
+        total_size = sum(entry["size"] for entry in self.manifest.values())
+        by_atime = sorted(self.manifest.items(), key=lambda item: item[1]["atime"])
+        
+        for entry_hash, entry in by_atime:
+            if total_size <= self.max_bytes:
+                break
+            # Entries from before the format was configurable are raw PCM
+            self._remove(entry_hash, entry.get("format", "pcm_44100"))
+            total_size -= entry["size"]
+            logger.info(f"Evicted cached speech {entry_hash[:12]}")
+    
+    def get(self, key_tuple):
+        """Get cached audio bytes for the given key, or None on a cache miss."""
+        entry_hash = self._hash(key_tuple)
+        output_format = key_tuple[3]
+        path = self._path(entry_hash, output_format)
+        
+        if not os.path.exists(path):
+            return None
+        
+        try:
+            with open(path, 'rb') as f:
+                audio_bytes = f.read()
+        except OSError as e:
+            logger.warning(f"Discarding unreadable cache entry {entry_hash[:12]}: {str(e)}")
+            with self._lock:
+                self._remove(entry_hash, output_format)
+                self._dirty = True
+            return None
+        
+        # Record the access for LRU eviction
+        with self._lock:
+            self.manifest[entry_hash] = {
+                "atime": time.time(),
+                "size": len(audio_bytes),
+                "format": output_format
+            }
+            self._dirty = True
+        
+        return audio_bytes
+    
+    def discard(self, key_tuple):
+        """Remove the entry for the given key, e.g. after it failed to decode."""
+        with self._lock:
+            self._remove(self._hash(key_tuple), key_tuple[3])
+            self._dirty = True
+    
+    def put(self, key_tuple, audio_bytes):
+        """Store audio bytes for the given key and return the cached file path."""
+        entry_hash = self._hash(key_tuple)
+        output_format = key_tuple[3]
+        path = self._path(entry_hash, output_format)
+        
+        # Write to a temp file and swap it in so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(audio_bytes)
+        os.replace(temp_path, path)
+        
+        with self._lock:
+            self.manifest[entry_hash] = {
+                "atime": time.time(),
+                "size": len(audio_bytes),
+                "format": output_format
+            }
+            self._evict()
+            self._save_manifest()
+        
+        return path
+
 
 class SpeechSynthesizer:
     """Synthesize speech using ElevenLabs API."""
     
-    def __init__(self, api_key_manager, voice_mapping=None):
-        """Initialize with API key manager and optional voice mapping."""
+    def __init__(self, api_key_manager, voice_mapping=None, tts_cache=None, output_format=OUTPUT_FORMAT):
+        """Initialize with API key manager, optional voice mapping, speech cache and API audio format."""
         self.api_key_manager = api_key_manager
         self.voice_mapping = voice_mapping or DEFAULT_VOICE_MAPPING
+        self.tts_cache = tts_cache or TTSCache()
+        self.output_format = output_format
+    
+    def _to_audio(self, audio_bytes):
+        """Decode audio returned by the API into an audio segment."""
+        codec, _, rate = self.output_format.partition("_")
+        
+        # Raw PCM only needs wrapping
+        if codec == "pcm":
+            return AudioSegment(
+                audio_bytes,
+                sample_width=SAMPLE_WIDTH,
+                frame_rate=int(rate),
+                channels=1  # ElevenLabs speech is mono
+            )
+        return AudioSegment.from_file(io.BytesIO(audio_bytes), format=codec)
     
     def synthesize(self, text, speaker):
         """Synthesize speech for given text and speaker."""
@@ -218,9 +483,23 @@ class SpeechSynthesizer:
             logger.warning("Empty text provided for synthesis, skipping")
             return None
         
-        api_key = self.api_key_manager.get_next_api_key()
         voice_id = self.voice_mapping.get(speaker, self.voice_mapping["Default"])
         
+        # Reuse previously synthesized audio for identical requests
+        cache_key = (voice_id, MODEL_ID, VOICE_SETTINGS, self.output_format, text)
+        audio_bytes = self.tts_cache.get(cache_key)
+        if audio_bytes is not None:
+            # A damaged entry is dropped and synthesized again rather than failing the podcast
+            try:
+                audio = self._to_audio(audio_bytes)
+                logger.info(f"Using cached speech for {speaker}: '{text[:50]}...'")
+                return audio
+            except Exception as e:
+                logger.warning(f"Discarding undecodable cached speech for {speaker}: {str(e)}")
+                self.tts_cache.discard(cache_key)
+        
+        api_key = self.api_key_manager.get_next_api_key(len(text))
+        
         # Set up the API request
         headers = {
             "xi-api-key": api_key,
@@ -229,21 +508,31 @@ class SpeechSynthesizer:
         
         data = {
             "text": text,
-            "model_id": "eleven_monolingual_v1",
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.75
-            }
+            "model_id": MODEL_ID,
+            "voice_settings": VOICE_SETTINGS
         }
         
-        endpoint = f"{ELEVENLABS_API_URL}/{voice_id}"
+        # Streaming endpoint starts sending audio before synthesis finishes
+        endpoint = f"{ELEVENLABS_API_URL}/{voice_id}/stream"
         
         try:
             # Make the API request
             logger.info(f"Synthesizing speech for {speaker}: '{text[:50]}...'")
-            response = requests.post(endpoint, json=data, headers=headers)
+            response = self.api_key_manager.session.post(
+                endpoint,
+                params={"output_format": self.output_format},
+                json=data,
+                headers=headers,
+                stream=True
+            )
             
             if response.status_code == 200:
+                # Collect the audio as it streams in
+                buffer = io.BytesIO()
+                for data_chunk in response.iter_content(chunk_size=4096):
+                    buffer.write(data_chunk)
+                audio_bytes = buffer.getvalue()
+                
                 # Calculate character count and credits used (1 character = 1 credit)
                 char_count = len(text)
                 credits_used = char_count
@@ -251,17 +540,9 @@ class SpeechSynthesizer:
                 # Log credit usage
                 self.api_key_manager.log_credit_usage(api_key, char_count, credits_used)
                 
-                # Create temp file for the audio
-                temp_file = f"temp_{int(time.time())}_{random.randint(1000, 9999)}.mp3"
-                
-                with open(temp_file, 'wb') as f:
-                    f.write(response.content)
-                
-                # Load audio with pydub
-                audio = AudioSegment.from_mp3(temp_file)
-                
-                # Clean up temp file
-                os.remove(temp_file)
+                # Cache the audio as returned by the API, once it is known to decode
+                audio = self._to_audio(audio_bytes)
+                self.tts_cache.put(cache_key, audio_bytes)
                 
                 return audio
             else:
@@ -285,49 +566,67 @@ class SoundEffectsManager:
             os.makedirs(self.sfx_dir)
             logger.info(f"Created directory: {self.sfx_dir}")
         
-        # Cache to avoid loading the same sound multiple times
+        # Index sound effect files by lowercase name once, sorted for prefix lookup
+        self._sfx_index = {}
+        for f in sorted(os.listdir(self.sfx_dir)):
+            fl = f.lower()
+            if fl.endswith(('.mp3', '.wav')):
+                self._sfx_index.setdefault(os.path.splitext(fl)[0], os.path.join(self.sfx_dir, f))
+        self._sfx_names = sorted(self._sfx_index)
+        
+        # Cache of samples already converted to the mix format and volume
         self.sfx_cache = {}
     
     def get_sfx_clip(self, effect_name, duration_ms=3000):
-        """Get sound effect clip with specified name and optional duration."""
+        """Get int16 samples of the named sound effect with optional duration."""
         # Check cache first
         if effect_name in self.sfx_cache:
-            clip = self.sfx_cache[effect_name]
+            samples = self.sfx_cache[effect_name]
         else:
-            # Look for file with matching name in SFX directory
-            effect_files = [
-                f for f in os.listdir(self.sfx_dir) 
-                if f.lower().startswith(effect_name.lower()) and 
-                f.lower().endswith(('.mp3', '.wav'))
-            ]
+            # Look up file with matching name in SFX directory
+            effect_path = self._find_effect(effect_name)
             
-            if not effect_files:
+            if not effect_path:
                 logger.warning(f"Sound effect '{effect_name}' not found")
                 return None
             
             # Load the sound effect
-            effect_path = os.path.join(self.sfx_dir, effect_files[0])
             try:
                 clip = AudioSegment.from_file(effect_path)
-                self.sfx_cache[effect_name] = clip
+                
+                # Convert once to the mix format and background volume
+                clip = clip.set_frame_rate(TARGET_FRAME_RATE)
+                clip = clip.set_channels(TARGET_CHANNELS)
+                clip = clip.set_sample_width(SAMPLE_WIDTH)
+                clip = clip.apply_gain(-10)  # Reduce volume by 10dB for background effects
+                
+                samples = np.frombuffer(clip.raw_data, dtype=np.int16)
+                self.sfx_cache[effect_name] = samples
             except Exception as e:
                 logger.error(f"Error loading sound effect '{effect_name}': {str(e)}")
                 return None
         
-        # Adjust volume and duration
-        clip = clip - 10  # Reduce volume by 10dB for background effects
-        
-        # If effect is longer than requested duration, trim it
-        if duration_ms and len(clip) > duration_ms:
-            clip = clip[:duration_ms]
-        
-        # If effect is shorter than requested duration, loop it
-        if duration_ms and len(clip) < duration_ms:
-            repetitions = duration_ms // len(clip) + 1
-            clip = clip * repetitions
-            clip = clip[:duration_ms]
+        if duration_ms:
+            n_samples = duration_ms * TARGET_FRAME_RATE // 1000 * TARGET_CHANNELS
+            
+            # If effect is longer than requested duration, trim it
+            if len(samples) > n_samples:
+                samples = samples[:n_samples]
+            
+            # If effect is shorter than requested duration, loop it
+            elif 0 < len(samples) < n_samples:
+                repetitions = -(-n_samples // len(samples))
+                samples = np.tile(samples, repetitions)[:n_samples]
         
-        return clip
+        return samples
+    
+    def _find_effect(self, effect_name):
+        """Find the file of the first sound effect whose name starts with effect_name."""
+        prefix = effect_name.lower()
+        i = bisect.bisect_left(self._sfx_names, prefix)
+        if i < len(self._sfx_names) and self._sfx_names[i].startswith(prefix):
+            return self._sfx_index[self._sfx_names[i]]
+        return None
 
 
 class PodcastGenerator:
@@ -346,78 +645,134 @@ class PodcastGenerator:
     
     def generate(self, script_path, output_file=None):
         """Generate a podcast from the given script."""
-        # Parse the script
-        parser = ScriptParser(script_path)
-        chunks = parser.parse()
-        
-        if not chunks:
-            logger.error("No valid content in script")
-            return False
-        
         # Generate default output filename if not provided
         if not output_file:
             script_name = os.path.basename(script_path).split('.')[0]
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = os.path.join(OUTPUT_DIR, f"{script_name}_{timestamp}.mp3")
         
-        # Process each chunk
-        podcast = AudioSegment.silent(duration=500)  # Start with 0.5s silence
-        
-        for i, chunk in enumerate(tqdm(chunks, desc="Generating podcast")):
-            if chunk["type"] == "dialogue":
-                # Synthesize speech
-                audio = self.speech_synthesizer.synthesize(
-                    chunk["text"], 
-                    chunk["speaker"]
-                )
-                
-                if audio:
-                    # Add a small silence before the dialogue
-                    podcast += AudioSegment.silent(duration=300)
-                    podcast += audio
-                
-            elif chunk["type"] == "sfx":
-                # Get sound effect
-                sfx_clip = self.sfx_manager.get_sfx_clip(chunk["effect"])
-                
-                if sfx_clip:
-                    # Overlap with previous audio or add to the end
-                    if len(podcast) > 2000:  # If podcast already has content
-                        # Get last 2 seconds of current podcast
-                        overlay_point = len(podcast) - 2000
-                        
-                        # Create a new audio segment with original audio
-                        new_segment = podcast[:overlay_point]
-                        
-                        # Create the overlapped section
-                        overlap_segment = podcast[overlay_point:]
-                        
-                        # Ensure sfx_clip is not longer than the section to overlay
-                        if len(sfx_clip) > len(overlap_segment):
-                            sfx_clip = sfx_clip[:len(overlap_segment)]
-                        
-                        # Overlay the sound effect
-                        overlapped = overlap_segment.overlay(sfx_clip)
-                        
-                        # Combine segments
-                        podcast = new_segment + overlapped
-                    else:
-                        podcast += sfx_clip
+        with ThreadPoolExecutor(max_workers=self.api_key_manager.max_concurrency) as executor:
+            # Parse the script, dispatching speech synthesis as soon as each chunk is read
+            parser = ScriptParser(script_path)
+            chunks = []
             
-            # Add a short silence between chunks
-            podcast += AudioSegment.silent(duration=200)
+            # Repeated lines by the same speaker are synthesized only once
+            unique_lines = {}
+            
+            for chunk in parser.iter_chunks():
+                chunks.append(chunk)
+                if chunk["type"] == "dialogue":
+                    key = (chunk["text"], chunk["speaker"])
+                    if key not in unique_lines:
+                        unique_lines[key] = executor.submit(
+                            self.speech_synthesizer.synthesize, *key
+                        )
+                    chunk["_future"] = unique_lines[key]
+                elif chunk["type"] == "sfx":
+                    # Sound effects come from local files, so load them synchronously
+                    chunk["_clip"] = self.sfx_manager.get_sfx_clip(chunk["effect"])
+            
+            if not chunks:
+                logger.error("No valid content in script")
+                return False
+            
+            # Mix chunks in script order as their audio becomes available
+            mix = self._assemble(chunks)
+        
+        # Persist credit usage and cache accesses for this podcast
+        self.api_key_manager.flush()
+        self.speech_synthesizer.tts_cache.flush()
+        
+        # Normalize audio levels in place
+        self._normalize(mix)
         
-        # Normalize audio levels
-        podcast = normalize(podcast)
+        # Wrap the mix buffer for export without copying it
+        podcast = AudioSegment(
+            memoryview(mix).cast("B"),
+            sample_width=SAMPLE_WIDTH,
+            frame_rate=TARGET_FRAME_RATE,
+            channels=TARGET_CHANNELS
+        )
         
         # Export the final podcast
         try:
-            podcast.export(output_file, format="mp3")
+            podcast.export(output_file, format="mp3", parameters=EXPORT_PARAMETERS)
             logger.info(f"Podcast saved to {output_file}")
             return True
         except Exception as e:
             logger.error(f"Error exporting podcast: {str(e)}")
             return False
+    
+    def _frames(self, duration_ms):
+        """Convert a duration in milliseconds to a number of frames in the mix."""
+        return duration_ms * TARGET_FRAME_RATE // 1000
+    
+    def _samples(self, audio):
+        """Convert an audio segment to int16 samples in the mix format."""
+        audio = audio.set_frame_rate(TARGET_FRAME_RATE)
+        audio = audio.set_channels(TARGET_CHANNELS)
+        audio = audio.set_sample_width(SAMPLE_WIDTH)
+        return np.frombuffer(audio.raw_data, dtype=np.int16)
+    
+    def _assemble(self, chunks):
+        """Mix dispatched chunks into a single int16 buffer in script order."""
+        intro = self._frames(500) * TARGET_CHANNELS  # Start with 0.5s silence
+        pre_dialogue = self._frames(300) * TARGET_CHANNELS
+        between_chunks = self._frames(200) * TARGET_CHANNELS
+        overlap = self._frames(2000) * TARGET_CHANNELS
+        
+        # First pass: resolve all audio and lay out (offset, samples, is_overlay)
+        layout = []
+        offset = intro
+        
+        for chunk in tqdm(chunks, desc="Generating podcast"):
+            if chunk["type"] == "dialogue":
+                audio = chunk["_future"].result()
+                
+                if audio:
+                    # Add a small silence before the dialogue
+                    offset += pre_dialogue
+                    samples = self._samples(audio)
+                    layout.append((offset, samples, False))
+                    offset += len(samples)
+            
+            elif chunk["_clip"] is not None:
+                # Sound effects are already in the mix format
+                samples = chunk["_clip"]
+                
+                if offset > overlap:
+                    # Overlay the sound effect on the last 2 seconds of the podcast
+                    layout.append((offset - overlap, samples[:overlap], True))
+                else:
+                    layout.append((offset, samples, False))
+                    offset += len(samples)
+            
+            # Add a short silence between chunks
+            offset += between_chunks
+        
+        # Second pass: fill a buffer allocated once at its exact final size,
+        # silences are simply the regions left at zero
+        mix = np.zeros(offset, dtype=np.int16)
+        
+        for start, samples, is_overlay in layout:
+            if is_overlay:
+                # Saturating add written straight back into the mix buffer
+                _overlay(mix, samples, start)
+            else:
+                mix[start:start + len(samples)] = samples
+        
+        return mix
+    
+    def _normalize(self, mix, headroom=0.1):
+        """Scale the mix in place so its peak sits headroom dB below full scale."""
+        peak = max(int(mix.max()), -int(mix.min()))
+        
+        # A silent podcast can't be normalized
+        if peak == 0:
+            return
+        
+        target_peak = 32768 * 10 ** (-headroom / 20)
+        np.multiply(mix, target_peak / peak, out=mix, casting="unsafe")
 
 
 def main():
@@ -6,7 +6,9 @@ Simple GUI for the Auto Podcast Generator
 """
 
 import os
+import re
 import sys
+import queue
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
 import threading
@@ -18,6 +20,11 @@ from pathlib import Path
 # Set the current directory as the base path
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_FILE = os.path.join(BASE_DIR, "podcast_config.ini")
+OUTPUT_POLL_MS = 100  # How often subprocess output is moved into the console
+OUTPUT_READ_SIZE = 65536  # Bytes read from the subprocess pipe at a time
+
+# Output lines end in \n, or in \r for progress bars that redraw in place
+_NEWLINE_RE = re.compile(rb"\r\n|\r|\n")
 
 
 class PodcastGeneratorUI:
@@ -36,9 +43,13 @@ class PodcastGeneratorUI:
         self.api_keys_var = tk.StringVar()
         self.config_path_var = tk.StringVar(value=CONFIG_FILE)
         
+        # Lines read from the generator process, drained into the console by the UI thread
+        self.output_queue = queue.Queue()
+        
         # Set up the UI
         self.create_widgets()
         self.load_config()
+        self.root.after(OUTPUT_POLL_MS, self.drain_output)
     
     def create_widgets(self):
         """Create UI widgets."""
@@ -290,42 +301,41 @@ class PodcastGeneratorUI:
             if os.path.exists(config_path):
                 config.read(config_path)
             
-            # Ensure all required sections exist
-            for section in ["General", "VoiceSynthesis", "SoundEffects", 
-                           "SoundEffectsPrompts", "Speakers", "Audio"]:
-                if not config.has_section(section):
-                    config.add_section(section)
-            
-            # Update voice settings
-            config["Speakers"]["bhaskar"] = self.bhaskar_voice_var.get()
-            config["Speakers"]["mishra"] = self.mishra_voice_var.get()
-            config["Speakers"]["default"] = self.default_voice_var.get()
-            
-            config["VoiceSynthesis"]["model"] = self.voice_model_var.get()
-            config["VoiceSynthesis"]["stability"] = "0.5"  # Default
-            config["VoiceSynthesis"]["similarity_boost"] = "0.75"  # Default
-            
-            # Update SFX settings
-            config["SoundEffects"]["sfx_model"] = "eleven_multilingual_v2"  # Better for SFX
-            config["SoundEffects"]["default_duration"] = "3000"  # Default
+            # Parse SFX prompts from the text box
+            sfx_prompts = {}
+            for prompt in self.sfx_prompts_text.get(1.0, tk.END).strip().splitlines():
+                if ":" in prompt:
+                    key, value = prompt.split(":", 1)
+                    sfx_prompts[key.strip().lower()] = value.strip()
             
-            # Update SFX prompts
-            # First clear existing prompts
-            if "SoundEffectsPrompts" in config:
+            # Prompts are replaced wholesale rather than merged
+            if config.has_section("SoundEffectsPrompts"):
                 config.remove_section("SoundEffectsPrompts")
-            config.add_section("SoundEffectsPrompts")
-            
-            # Add new prompts
-            sfx_prompts = self.sfx_prompts_text.get(1.0, tk.END).strip().split("\n")
-            for prompt in sfx_prompts:
-                if prompt and ":" in prompt:
-                    key, value = prompt.split(":", 1)
-                    config["SoundEffectsPrompts"][key.strip()] = value.strip()
             
-            # Update audio settings
-            config["Audio"]["format"] = "mp3"  # Default
-            config["Audio"]["bit_rate"] = "192k"  # Default
-            config["Audio"]["normalize_audio"] = "True"  # Default
+            # Apply all settings from the form in one pass
+            config.read_dict({
+                "General": {},
+                "Speakers": {
+                    "bhaskar": self.bhaskar_voice_var.get(),
+                    "mishra": self.mishra_voice_var.get(),
+                    "default": self.default_voice_var.get()
+                },
+                "VoiceSynthesis": {
+                    "model": self.voice_model_var.get(),
+                    "stability": "0.5",  # Default
+                    "similarity_boost": "0.75"  # Default
+                },
+                "SoundEffects": {
+                    "sfx_model": "eleven_multilingual_v2",  # Better for SFX
+                    "default_duration": "3000"  # Default
+                },
+                "SoundEffectsPrompts": sfx_prompts,
+                "Audio": {
+                    "format": "mp3",  # Default
+                    "bit_rate": "192k",  # Default
+                    "normalize_audio": "True"  # Default
+                }
+            })
             
             # Save to file
             with open(config_path, 'w') as f:
@@ -339,11 +349,31 @@ class PodcastGeneratorUI:
     
     def log_to_console(self, message):
         """Log message to console output."""
+        self.log_batch([message])
+    
+    def log_batch(self, lines):
+        """Log several messages to console output with a single insert."""
+        if not lines:
+            return
+        
         self.console_output.config(state=tk.NORMAL)
-        self.console_output.insert(tk.END, f"{message}\n")
+        self.console_output.insert(tk.END, "\n".join(lines) + "\n")
         self.console_output.see(tk.END)
         self.console_output.config(state=tk.DISABLED)
     
+    def drain_output(self):
+        """Move queued subprocess output into the console in a single insert."""
+        lines = []
+        try:
+            while True:
+                lines.append(self.output_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        self.log_batch(lines)
+        
+        self.root.after(OUTPUT_POLL_MS, self.drain_output)
+    
     def generate_podcast(self):
         """Generate podcast based on current settings."""
         # Validate inputs
@@ -395,12 +425,26 @@ class PodcastGeneratorUI:
                 cmd, 
                 stdout=subprocess.PIPE, 
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+                bufsize=OUTPUT_READ_SIZE
             )
             
-            for line in process.stdout:
-                self.root.after(10, self.log_to_console, line.strip())
+            # Read whatever output is available in large blocks and split it into lines
+            pending = b""
+            while True:
+                data = process.stdout.read1(OUTPUT_READ_SIZE)
+                if not data:
+                    break
+                
+                # A trailing \r may be the first half of \r\n, so hold it for the next read
+                buffer = pending + data
+                cut = len(buffer) - 1 if buffer.endswith(b"\r") else len(buffer)
+                *lines, pending = _NEWLINE_RE.split(buffer[:cut])
+                pending += buffer[cut:]
+                for line in lines:
+                    self.output_queue.put_nowait(line.decode("utf-8", "replace").strip())
+            
+            if pending:
+                self.output_queue.put_nowait(pending.decode("utf-8", "replace").strip())
             
             process.wait()
             
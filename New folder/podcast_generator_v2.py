@@ -7,21 +7,48 @@ This script converts formatted text scripts into podcasts with voices and sound
 all generated through ElevenLabs API with credit tracking and rotation.
 """
 
+import io
 import os
+import wave
 import json
+import atexit
 import time
 import random
+import hashlib
 import logging
 import argparse
+import tempfile
+import threading
+import subprocess
 import requests
 import configparser
-from datetime import datetime
+import numpy as np
+from collections import OrderedDict, defaultdict
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass
+from functools import cached_property
 from pydub import AudioSegment
-from pydub.effects import normalize, speedup
+from pydub.effects import speedup
 from dotenv import load_dotenv
 from tqdm import tqdm
 import re
 
+# Optional: faster JSON encoding for the credits log
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional JIT for the sound effect overlay kernel
+try:
+    import numba
+except ImportError:
+    numba = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -44,17 +71,29 @@ USAGE_API_URL = "https://api.elevenlabs.io/v1/user/subscription"
 OUTPUT_DIR = "output"
 CREDITS_LOG_FILE = "credits_log.json"
 CONFIG_FILE = "podcast_config.ini"
+TARGET_FRAME_RATE = 44100
+TARGET_CHANNELS = 1
+SAMPLE_WIDTH = 2  # 16-bit PCM
+MAX_RETRY_DELAY = 60  # Upper bound in seconds for rate-limit backoff
+MAX_CONSECUTIVE_429 = 2  # Rate limits in a row before moving off a key
+
+# Script tags: [SPEAKER: name] and [SFX: effect]
+_TAG_RE = re.compile(r'\[(SPEAKER|SFX):\s*([^\]]+)\]')
 
 # Default configuration
 DEFAULT_CONFIG = {
     "General": {
         "output_dir": "output",
         "credits_log_file": "credits_log.json",
-        "temp_dir": "temp"
+        "cache_dir": "cache",
+        "cache_max_mb": "500",
+        "buffer_max_mb": "512",
+        "batch_concurrency": "3"
     },
     "Audio": {
         "format": "mp3",
         "bit_rate": "192k",
+        "api_output_format": "mp3_44100_128",
         "normalize_audio": "True",
         "silence_between_chunks": "200",
         "intro_silence": "500"
@@ -70,7 +109,8 @@ DEFAULT_CONFIG = {
         "default_duration": "3000",
         "volume_reduction": "10",
         "sfx_overlap": "True",
-        "sfx_model": "eleven_multilingual_v2"
+        "sfx_model": "eleven_multilingual_v2",
+        "cache_max_entries": "64"
     },
     "Speakers": {
         "default": "21m00Tcm4TlvDq8ikWAM",  # Rachel
@@ -92,11 +132,85 @@ DEFAULT_CONFIG = {
     "APIRotation": {
         "retry_failed_calls": "True",
         "max_retries": "3",
-        "retry_delay": "2"
+        "retry_delay": "2",
+        "flush_every": "25"
     }
 }
 
 
+def _frames(ms):
+    """Number of frames in the given duration at the podcast frame rate."""
+    return int(ms * TARGET_FRAME_RATE / 1000)
+
+
+def _conform(audio):
+    """Convert a segment to the podcast sample format so its samples can be joined."""
+    return audio.set_frame_rate(TARGET_FRAME_RATE).set_channels(TARGET_CHANNELS).set_sample_width(SAMPLE_WIDTH)
+
+
+def _decode(audio_bytes, output_format):
+    """Decode API audio returned in the given ElevenLabs output format."""
+    codec, _, rate = output_format.partition("_")
+    # PCM formats are bare 16-bit mono samples, e.g. pcm_44100
+    if codec == "pcm":
+        return AudioSegment(
+            audio_bytes,
+            sample_width=SAMPLE_WIDTH,
+            frame_rate=int(rate),
+            channels=1
+        )
+    # Other formats name their container first, e.g. mp3_44100_128 or opus_48000_64
+    return AudioSegment.from_file(io.BytesIO(audio_bytes), format=codec)
+
+
+def _overlay_numpy(dst, src, offset):
+    """Add src into dst at offset in place, saturating at the int16 range."""
+    end = offset + len(src)
+    np.clip(
+        dst[offset:end].astype(np.int32) + src,
+        -32768, 32767, out=dst[offset:end], casting="unsafe"
+    )
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _overlay(dst, src, offset):
+        """Add src into dst at offset in place, saturating at the int16 range."""
+        for i in range(src.shape[0]):
+            v = np.int32(dst[offset + i]) + np.int32(src[i])
+            if v > 32767:
+                v = 32767
+            elif v < -32768:
+                v = -32768
+            dst[offset + i] = v
+else:
+    _overlay = _overlay_numpy
+
+
+def _retry_after(response):
+    """Seconds the server asked us to wait via Retry-After, or None."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    
+    # The header is either a number of seconds or an HTTP date
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class _ServerErrorRetry(Retry):
+    """urllib3 retry policy that leaves rate limits (429) to make_api_call."""
+    # Only a 503's Retry-After is honored here; a 429 must reach make_api_call
+    # so it can back off with a cap and rotate keys
+    RETRY_AFTER_STATUS_CODES = frozenset({503})
+
+
 class ConfigManager:
     """Manages configuration for the podcast generator."""
     
@@ -211,6 +325,36 @@ class ConfigManager:
         return {k: v for k, v in self.config.items("SoundEffectsPrompts")}
 
 
+@dataclass(frozen=True)
+class VoiceSettings:
+    """Snapshot of the voice synthesis configuration, read once per run."""
+    model: str
+    stability: float
+    similarity_boost: float
+    style: float
+    use_speaker_boost: bool
+    
+    @classmethod
+    def from_config(cls, config):
+        """Read voice synthesis settings from the configuration."""
+        return cls(
+            model=config.get("VoiceSynthesis", "model"),
+            stability=config.getfloat("VoiceSynthesis", "stability"),
+            similarity_boost=config.getfloat("VoiceSynthesis", "similarity_boost"),
+            style=config.getfloat("VoiceSynthesis", "style", fallback=0.0),
+            use_speaker_boost=config.getboolean("VoiceSynthesis", "use_speaker_boost", fallback=True)
+        )
+    
+    def to_payload(self):
+        """Get the voice_settings object for an ElevenLabs request."""
+        return {
+            "stability": self.stability,
+            "similarity_boost": self.similarity_boost,
+            "style": self.style,
+            "use_speaker_boost": self.use_speaker_boost
+        }
+
+
 class ApiKeyManager:
     """Manages and rotates between multiple ElevenLabs API keys."""
     
@@ -229,6 +373,8 @@ class ApiKeyManager:
                 self.api_keys = []
                 
         self.current_index = 0
+        self._lock = threading.Lock()
+        self._consecutive_429 = defaultdict(int)
         self.credits_log_file = self.config.get("General", "credits_log_file", 
                                                fallback=CREDITS_LOG_FILE)
         self.credits_log = self._load_credits_log()
@@ -237,18 +383,47 @@ class ApiKeyManager:
         self.max_retries = self.config.getint("APIRotation", "max_retries", fallback=3)
         self.retry_delay = self.config.getint("APIRotation", "retry_delay", fallback=2)
         
+        # Keys that hit a rate limit are skipped by rotation until this monotonic time
+        self._cooldown_until = {}
+        
+        # Credit usage is buffered in memory and written every flush_every calls
+        self._flush_every = self.config.getint("APIRotation", "flush_every", fallback=25)
+        self._dirty_count = 0
+        atexit.register(self.flush)
+        
         if not self.api_keys:
             logger.error("No API keys found. Please provide at least one API key.")
             raise ValueError("No API keys provided")
         
+        # Requests are network-bound, so run several per API key at once
+        self.max_workers = self.config.getint(
+            "APIRotation", "max_workers", fallback=4 * len(self.api_keys)
+        )
+        
+        # Transient server and connection errors are retried by urllib3 on the same key;
+        # 429 and 401 are left to make_api_call, which rotates keys for them
+        retry = _ServerErrorRetry(
+            total=self.max_retries if self.retry_failed_calls else 0,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+            backoff_factor=self.retry_delay,
+            raise_on_status=False
+        )
+        
+        # One pooled session so every worker reuses a kept-alive TLS connection
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.max_workers, pool_block=True, max_retries=retry
+        ))
+        
         logger.info(f"Initialized with {len(self.api_keys)} API keys")
     
     def _load_credits_log(self):
         """Load credits log from file or create a new one."""
         if os.path.exists(self.credits_log_file):
             try:
-                with open(self.credits_log_file, 'r') as f:
-                    return json.load(f)
+                with open(self.credits_log_file, 'rb') as f:
+                    return orjson.loads(f.read()) if orjson else json.load(f)
             except json.JSONDecodeError:
                 logger.warning(f"Error reading {self.credits_log_file}, creating new log")
         
@@ -262,37 +437,61 @@ class ApiKeyManager:
     
     def _save_credits_log(self):
         """Save credits log to file."""
-        with open(self.credits_log_file, 'w') as f:
-            json.dump(self.credits_log, f, indent=2)
+        # Write to a temp file and swap it in so a crash never leaves a truncated log
+        temp_file = self.credits_log_file + ".tmp"
+        if orjson:
+            with open(temp_file, 'wb') as f:
+                f.write(orjson.dumps(self.credits_log, option=orjson.OPT_INDENT_2))
+        else:
+            with open(temp_file, 'w') as f:
+                json.dump(self.credits_log, f, indent=2)
+        os.replace(temp_file, self.credits_log_file)
+        self._dirty_count = 0
+    
+    def flush(self):
+        """Write buffered credit usage to the credits log file."""
+        with self._lock:
+            if self._dirty_count:
+                self._save_credits_log()
         
     def get_next_api_key(self):
-        """Get the next API key in rotation."""
-        api_key = self.api_keys[self.current_index]
-        # Update index for next call
-        self.current_index = (self.current_index + 1) % len(self.api_keys)
-        return api_key
+        """Get the next API key in rotation, skipping keys cooling down from a rate limit."""
+        with self._lock:
+            now = time.monotonic()
+            for _ in range(len(self.api_keys)):
+                api_key = self.api_keys[self.current_index]
+                # Update index for next call
+                self.current_index = (self.current_index + 1) % len(self.api_keys)
+                if self._cooldown_until.get(api_key, 0) <= now:
+                    return api_key
+            
+            # Every key is cooling down, so use the one that recovers first
+            return min(self.api_keys, key=lambda key: self._cooldown_until.get(key, 0))
     
     def log_credit_usage(self, api_key, character_count, credits_used, operation_type="speech"):
         """Log credit usage for a specific API key."""
         key_id = api_key[:8] + '...'
-        if key_id not in self.credits_log:
-            self.credits_log[key_id] = {
-                "total_credits_used": 0,
-                "calls": []
-            }
-        
-        # Update total credits used
-        self.credits_log[key_id]["total_credits_used"] += credits_used
-        
-        # Add call details
-        self.credits_log[key_id]["calls"].append({
-            "timestamp": datetime.now().isoformat(),
-            "operation_type": operation_type,
-            "character_count": character_count,
-            "credits_used": credits_used
-        })
-        
-        self._save_credits_log()
+        with self._lock:
+            if key_id not in self.credits_log:
+                self.credits_log[key_id] = {
+                    "total_credits_used": 0,
+                    "calls": []
+                }
+            
+            # Update total credits used
+            self.credits_log[key_id]["total_credits_used"] += credits_used
+            
+            # Add call details
+            self.credits_log[key_id]["calls"].append({
+                "timestamp": datetime.now().isoformat(),
+                "operation_type": operation_type,
+                "character_count": character_count,
+                "credits_used": credits_used
+            })
+            
+            self._dirty_count += 1
+            if self._dirty_count >= self._flush_every:
+                self._save_credits_log()
         logger.info(f"Logged {credits_used} credits for {operation_type} operation using API key {key_id}")
     
     def get_remaining_credits(self, api_key):
@@ -300,7 +499,7 @@ class ApiKeyManager:
         headers = {"xi-api-key": api_key}
         
         try:
-            response = requests.get(USAGE_API_URL, headers=headers)
+            response = self.session.get(USAGE_API_URL, headers=headers)
             if response.status_code == 200:
                 data = response.json()
                 return data.get("character_count", 0), data.get("character_limit", 0)
@@ -311,52 +510,81 @@ class ApiKeyManager:
             logger.error(f"Error getting remaining credits: {str(e)}")
             return None, None
     
+    def character_cost(self, response, fallback):
+        """Get the credits billed for a response from its headers, or fallback if absent."""
+        cost = response.headers.get("character-cost") or response.headers.get("x-character-cost")
+        try:
+            return int(cost)
+        except (TypeError, ValueError):
+            return fallback
+    
     def make_api_call(self, url, headers, data=None, json_data=None, files=None, method="POST"):
-        """Make API call with retry logic and key rotation."""
+        """Make API call, rotating keys on rate-limit and auth failures."""
         current_attempt = 0
+        delay = self.retry_delay
         while current_attempt < self.max_retries:
             try:
                 # Get current API key
                 if "xi-api-key" not in headers:
-                    api_key = self.get_next_api_key()
-                    headers["xi-api-key"] = api_key
+                    headers["xi-api-key"] = self.get_next_api_key()
+                api_key = headers["xi-api-key"]
                 
                 # Make the request
                 if method.upper() == "GET":
-                    response = requests.get(url, headers=headers, params=data)
+                    response = self.session.get(url, headers=headers, params=data)
                 else:  # POST
-                    response = requests.post(
+                    response = self.session.post(
                         url, headers=headers, data=data, json=json_data, files=files
                     )
                 
                 # If successful, return response
                 if response.status_code == 200:
-                    return response, headers["xi-api-key"]
+                    with self._lock:
+                        self._consecutive_429.pop(api_key, None)
+                    return response, api_key
                 
-                # If rate limited or credit issue, try a different key
-                if response.status_code in [429, 401]:
-                    logger.warning(f"API key issue (status {response.status_code}), rotating key")
-                    api_key = self.get_next_api_key()
-                    headers["xi-api-key"] = api_key
+                # An auth failure is permanent for this key, so switch immediately
+                if response.status_code == 401:
+                    logger.warning("API key rejected (status 401), rotating key")
+                    headers["xi-api-key"] = self.get_next_api_key()
                     current_attempt += 1
-                    time.sleep(self.retry_delay)
                     continue
                 
-                # Other error
-                logger.error(f"API call failed: {response.status_code}, {response.text}")
-                if not self.retry_failed_calls:
-                    return None, headers["xi-api-key"]
+                # A single rate limit is usually a burst; only rotate if it repeats
+                if response.status_code == 429:
+                    current_attempt += 1
+                    # Decorrelated jitter keeps concurrent workers from retrying in lockstep
+                    delay = min(MAX_RETRY_DELAY, random.uniform(self.retry_delay, delay * 3))
+                    
+                    # Wait at least as long as the server asked, when it says
+                    retry_after = _retry_after(response)
+                    if retry_after is not None:
+                        delay = min(MAX_RETRY_DELAY, max(delay, retry_after))
+                    
+                    with self._lock:
+                        # Other workers move to a different key while this one cools down
+                        self._cooldown_until[api_key] = time.monotonic() + delay
+                        self._consecutive_429[api_key] += 1
+                        strikes = self._consecutive_429[api_key]
+                        if strikes >= MAX_CONSECUTIVE_429:
+                            self._consecutive_429[api_key] = 0
+                    
+                    if strikes >= MAX_CONSECUTIVE_429:
+                        logger.warning(f"API key rate limited {strikes} times in a row, rotating key")
+                        headers["xi-api-key"] = self.get_next_api_key()
+                    else:
+                        logger.warning("API key rate limited (status 429), retrying")
+                    
+                    time.sleep(delay)
+                    continue
                 
-                current_attempt += 1
-                time.sleep(self.retry_delay)
+                # Other error; transient ones were already retried by the session
+                logger.error(f"API call failed: {response.status_code}, {response.text}")
+                return None, api_key
                 
             except Exception as e:
                 logger.error(f"Error making API call: {str(e)}")
-                if not self.retry_failed_calls:
-                    return None, headers.get("xi-api-key")
-                
-                current_attempt += 1
-                time.sleep(self.retry_delay)
+                return None, headers.get("xi-api-key")
         
         logger.error(f"Failed to make API call after {self.max_retries} attempts")
         return None, headers.get("xi-api-key")
@@ -371,85 +599,224 @@ class ScriptParser:
         
     def parse(self):
         """Parse the script into a list of chunks (dialogue or SFX)."""
-        chunks = []
+        return list(self.parse_iter())
+    
+    def parse_iter(self):
+        """Yield chunks (dialogue or SFX) from the script as they are read."""
         current_speaker = "Default"
+        buffer = []
+        
+        def _flush():
+            """Take any buffered text as a dialogue chunk for the current speaker."""
+            if not buffer:
+                return None
+            chunk = {
+                "type": "dialogue",
+                "speaker": current_speaker,
+                "text": " ".join(buffer)
+            }
+            buffer.clear()
+            return chunk
         
         try:
             with open(self.script_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            buffer = []
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Check for speaker tag
-                speaker_match = re.match(r'\[SPEAKER:\s*([^\]]+)\]', line)
-                if speaker_match:
-                    # If there's text in buffer, add it as a chunk with previous speaker
-                    if buffer:
-                        chunks.append({
-                            "type": "dialogue",
-                            "speaker": current_speaker,
-                            "text": " ".join(buffer)
-                        })
-                        buffer = []
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
                     
-                    current_speaker = speaker_match.group(1).strip()
-                    continue
-                
-                # Check for SFX tag
-                sfx_match = re.match(r'\[SFX:\s*([^\]]+)\]', line)
-                if sfx_match:
-                    # If there's text in buffer, add it as a chunk
-                    if buffer:
-                        chunks.append({
-                            "type": "dialogue",
-                            "speaker": current_speaker,
-                            "text": " ".join(buffer)
-                        })
-                        buffer = []
+                    # Check for speaker or SFX tag in a single scan
+                    tag_match = _TAG_RE.match(line)
+                    if tag_match:
+                        # Text so far belongs to the previous speaker
+                        chunk = _flush()
+                        if chunk:
+                            yield chunk
+                        
+                        tag, value = tag_match.group(1), tag_match.group(2).strip()
+                        if tag == "SPEAKER":
+                            current_speaker = value
+                        else:
+                            # Yield the SFX as a chunk
+                            yield {
+                                "type": "sfx",
+                                "effect": value
+                            }
+                        continue
                     
-                    # Add the SFX as a chunk
-                    chunks.append({
-                        "type": "sfx",
-                        "effect": sfx_match.group(1).strip()
-                    })
-                    continue
-                
-                # If it's a regular line, add to buffer
-                buffer.append(line)
-            
-            # Add any remaining text in buffer
-            if buffer:
-                chunks.append({
-                    "type": "dialogue",
-                    "speaker": current_speaker,
-                    "text": " ".join(buffer)
-                })
+                    # If it's a regular line, add to buffer
+                    buffer.append(line)
             
-            return chunks
+            # Yield any remaining text in buffer
+            chunk = _flush()
+            if chunk:
+                yield chunk
         
         except Exception as e:
             logger.error(f"Error parsing script: {str(e)}")
             raise
 
 
+class AudioCache:
+    """Content-addressed on-disk cache for API audio responses with LRU eviction."""
+    
+    def __init__(self, cache_dir="cache", max_bytes=500 * 1024 * 1024, output_format="mp3_44100_128"):
+        """Initialize with path to cache directory, maximum cache size in bytes and API audio format."""
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.output_format = output_format
+        
+        # v1's speech cache uses the same default directory with its own manifest.json
+        self.manifest_file = os.path.join(self.cache_dir, "manifest_v2.json")
+        
+        # Create cache directory if it doesn't exist
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+            logger.info(f"Created directory: {self.cache_dir}")
+        
+        # Manifest maps entry hash to last access time and size for eviction.
+        # Accesses are recorded in memory and written out by put() or flush()
+        self.manifest = self._load_manifest()
+        self._lock = threading.Lock()
+        self._dirty = False
+        atexit.register(self.flush)
+    
+    @classmethod
+    def from_config(cls, config):
+        """Create a cache using the directory, size cap and audio format from the configuration."""
+        return cls(
+            config.get("General", "cache_dir", fallback="cache"),
+            config.getint("General", "cache_max_mb", fallback=500) * 1024 * 1024,
+            config.get("Audio", "api_output_format", fallback="mp3_44100_128")
+        )
+    
+    def _load_manifest(self):
+        """Load cache manifest from file or create a new one."""
+        if os.path.exists(self.manifest_file):
+            try:
+                with open(self.manifest_file, 'r') as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                logger.warning(f"Error reading {self.manifest_file}, creating new manifest")
+        
+        return {}
+    
+    def _save_manifest(self):
+        """Save cache manifest to file."""
+        # Write to a temp file and swap it in so a crash never leaves a truncated manifest
+        temp_file = self.manifest_file + ".tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(temp_file, self.manifest_file)
+        self._dirty = False
+    
+    def flush(self):
+        """Write recorded cache accesses to the manifest file."""
+        with self._lock:
+            if self._dirty:
+                self._save_manifest()
+    
+    def _hash(self, key):
+        """Hash a JSON-serializable request key."""
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+    
+    def _path(self, entry_hash, output_format):
+        """Get the file path for a cache entry, named after its audio format."""
+        return os.path.join(self.cache_dir, f"{entry_hash}.{output_format.split('_')[0]}")
+    
+    def _remove(self, entry_hash, output_format):
+        """Remove a cache entry from disk and from the manifest."""
+        self.manifest.pop(entry_hash, None)
+        path = self._path(entry_hash, output_format)
+        if os.path.exists(path):
+            os.remove(path)
+    
+    def _evict(self):
+        """Evict least recently used entries until the cache fits its size cap."""
+        total_size = sum(entry["size"] for entry in self.manifest.values())
+        by_atime = sorted(self.manifest.items(), key=lambda item: item[1]["atime"])
+        
+        for entry_hash, entry in by_atime:
+            if total_size <= self.max_bytes:
+                break
+            self._remove(entry_hash, entry.get("format", "mp3_44100_128"))
+            total_size -= entry["size"]
+            logger.info(f"Evicted cached audio {entry_hash[:12]}")
+    
+    def get(self, key):
+        """Get cached audio bytes for the given key, or None on a cache miss."""
+        entry_hash = self._hash(key)
+        path = self._path(entry_hash, self.output_format)
+        
+        if not os.path.exists(path):
+            return None
+        
+        try:
+            with open(path, 'rb') as f:
+                audio_bytes = f.read()
+        except OSError as e:
+            logger.warning(f"Discarding unreadable cache entry {entry_hash[:12]}: {str(e)}")
+            with self._lock:
+                self._remove(entry_hash, self.output_format)
+                self._dirty = True
+            return None
+        
+        # Record the access for LRU eviction
+        with self._lock:
+            self.manifest[entry_hash] = {
+                "atime": time.time(),
+                "size": len(audio_bytes),
+                "format": self.output_format
+            }
+            self._dirty = True
+        
+        return audio_bytes
+    
+    def discard(self, key):
+        """Remove the entry for the given key, e.g. after it failed to decode."""
+        with self._lock:
+            self._remove(self._hash(key), self.output_format)
+            self._dirty = True
+    
+    def put(self, key, audio_bytes):
+        """Store audio bytes for the given key."""
+        entry_hash = self._hash(key)
+        
+        # Write to a temp file and swap it in so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(audio_bytes)
+        os.replace(temp_path, self._path(entry_hash, self.output_format))
+        
+        with self._lock:
+            self.manifest[entry_hash] = {
+                "atime": time.time(),
+                "size": len(audio_bytes),
+                "format": self.output_format
+            }
+            self._evict()
+            self._save_manifest()
+
+
 class SpeechSynthesizer:
     """Synthesize speech using ElevenLabs API."""
     
-    def __init__(self, api_key_manager, config=None):
-        """Initialize with API key manager and optional configuration."""
+    def __init__(self, api_key_manager, config=None, audio_cache=None, settings=None):
+        """Initialize with API key manager, optional configuration, audio cache and voice settings."""
         self.api_key_manager = api_key_manager
         self.config = config or ConfigManager()
-        self.voice_mapping = self.config.get_all_speakers()
+        self.audio_cache = audio_cache or AudioCache.from_config(self.config)
+        self.settings = settings or VoiceSettings.from_config(self.config)
         
-        # Set up temp directory
-        self.temp_dir = self.config.get("General", "temp_dir", fallback="temp")
-        if not os.path.exists(self.temp_dir):
-            os.makedirs(self.temp_dir)
+        # Speaker lookups are case-insensitive, so normalize the mapping once
+        self.voice_mapping = {k.lower(): v for k, v in self.config.get_all_speakers().items()}
+        self.default_voice = self.voice_mapping.get("default", "21m00Tcm4TlvDq8ikWAM")  # Default to Rachel
+        
+        # Request payload fragment shared by every synthesize call
+        self.voice_settings = self.settings.to_payload()
+        
+        # pcm_44100 skips the MP3 decode and resample, but needs a Pro plan
+        self.output_format = self.config.get("Audio", "api_output_format", fallback="mp3_44100_128")
     
     def synthesize(self, text, speaker):
         """Synthesize speech for given text and speaker."""
@@ -458,14 +825,10 @@ class SpeechSynthesizer:
             return None
         
         # Get speaker voice ID
-        speaker_key = speaker.lower()
-        voice_id = self.voice_mapping.get(
-            speaker_key, 
-            self.voice_mapping.get("default", "21m00Tcm4TlvDq8ikWAM")  # Default to Rachel
-        )
+        voice_id = self.voice_mapping.get(speaker.lower(), self.default_voice)
         
         # Set up API request parameters
-        url = f"{ELEVENLABS_SPEECH_API_URL}/{voice_id}"
+        url = f"{ELEVENLABS_SPEECH_API_URL}/{voice_id}?output_format={self.output_format}"
         headers = {
             "Content-Type": "application/json",
             # API key will be added by the api_key_manager
@@ -473,15 +836,23 @@ class SpeechSynthesizer:
         
         data = {
             "text": text,
-            "model_id": self.config.get("VoiceSynthesis", "model"),
-            "voice_settings": {
-                "stability": self.config.getfloat("VoiceSynthesis", "stability"),
-                "similarity_boost": self.config.getfloat("VoiceSynthesis", "similarity_boost"),
-                "style": self.config.getfloat("VoiceSynthesis", "style", fallback=0.0),
-                "use_speaker_boost": self.config.getboolean("VoiceSynthesis", "use_speaker_boost", fallback=True)
-            }
+            "model_id": self.settings.model,
+            "voice_settings": self.voice_settings
         }
         
+        # Identical requests return identical audio, so reuse it across runs
+        cache_key = [url, data]
+        audio_bytes = self.audio_cache.get(cache_key)
+        if audio_bytes is not None:
+            # A damaged entry is dropped and fetched again rather than failing the podcast
+            try:
+                audio = _decode(audio_bytes, self.output_format)
+                logger.info(f"Using cached speech for '{speaker}': {len(text)} chars")
+                return audio
+            except Exception as e:
+                logger.warning(f"Discarding undecodable cached speech for '{speaker}': {str(e)}")
+                self.audio_cache.discard(cache_key)
+        
         try:
             # Make the API request with rotation and retry
             response, api_key = self.api_key_manager.make_api_call(
@@ -491,29 +862,19 @@ class SpeechSynthesizer:
             )
             
             if response:
-                # Calculate character count and credits used (1 character = 1 credit)
+                self.audio_cache.put(cache_key, response.content)
+                
+                # Use the billed cost reported by the API, falling back to 1 credit per character
                 char_count = len(text)
-                credits_used = char_count
+                credits_used = self.api_key_manager.character_cost(response, char_count)
                 
                 # Log credit usage
                 self.api_key_manager.log_credit_usage(
                     api_key, char_count, credits_used, "speech_synthesis"
                 )
                 
-                # Create temp file for the audio
-                temp_file = os.path.join(
-                    self.temp_dir,
-                    f"speech_{int(time.time())}_{random.randint(1000, 9999)}.mp3"
-                )
-                
-                with open(temp_file, 'wb') as f:
-                    f.write(response.content)
-                
-                # Load audio with pydub
-                audio = AudioSegment.from_mp3(temp_file)
-                
-                # Clean up temp file
-                os.remove(temp_file)
+                # Decode the audio in memory
+                audio = _decode(response.content, self.output_format)
                 
                 logger.info(f"Successfully synthesized speech for '{speaker}': {len(text)} chars")
                 return audio
@@ -529,23 +890,60 @@ class SpeechSynthesizer:
 class SoundEffectsGenerator:
     """Generate sound effects using ElevenLabs API."""
     
-    def __init__(self, api_key_manager, config=None):
-        """Initialize with API key manager and optional configuration."""
+    def __init__(self, api_key_manager, config=None, audio_cache=None):
+        """Initialize with API key manager, optional configuration and audio cache."""
         self.api_key_manager = api_key_manager
         self.config = config or ConfigManager()
         self.sfx_prompts = self.config.get_all_sfx_prompts()
+        self.audio_cache = audio_cache or AudioCache.from_config(self.config)
         
         # SFX generation parameters
         self.default_duration = self.config.getint("SoundEffects", "default_duration", fallback=3000)
         self.volume_reduction = self.config.getint("SoundEffects", "volume_reduction", fallback=10)
         self.sfx_overlap = self.config.getboolean("SoundEffects", "sfx_overlap", fallback=True)
         self.sfx_model = self.config.get("SoundEffects", "sfx_model", fallback="eleven_multilingual_v2")
+        self.output_format = self.config.get("Audio", "api_output_format", fallback="mp3_44100_128")
         
-        # Set up cache and temp directory
-        self.sfx_cache = {}
-        self.temp_dir = self.config.get("General", "temp_dir", fallback="temp")
-        if not os.path.exists(self.temp_dir):
-            os.makedirs(self.temp_dir)
+        # Set up LRU cache of processed effects; decoded PCM is large, so bound it
+        self.sfx_cache = OrderedDict()
+        self._sfx_cache_max = self.config.getint("SoundEffects", "cache_max_entries", fallback=64)
+        self._sfx_cache_lock = threading.Lock()
+    
+    def _cache_get(self, cache_key):
+        """Get a processed effect from the in-memory cache, or None on a miss."""
+        with self._sfx_cache_lock:
+            sfx = self.sfx_cache.get(cache_key)
+            if sfx is not None:
+                self.sfx_cache.move_to_end(cache_key)
+            return sfx
+    
+    def _cache_put(self, cache_key, sfx):
+        """Add a processed effect to the in-memory cache, evicting the least recently used."""
+        with self._sfx_cache_lock:
+            self.sfx_cache[cache_key] = sfx
+            self.sfx_cache.move_to_end(cache_key)
+            if len(self.sfx_cache) > self._sfx_cache_max:
+                self.sfx_cache.popitem(last=False)
+    
+    def _process(self, sfx, duration_ms):
+        """Apply volume reduction and fit a decoded effect to the requested duration."""
+        sfx = _conform(sfx)
+        samples = np.frombuffer(sfx.raw_data, dtype=np.int16)
+        
+        # Apply volume reduction
+        gain = 10 ** (-self.volume_reduction / 20)
+        samples = np.clip(samples * gain, -32768, 32767).astype(np.int16)
+        
+        # Adjust duration if needed
+        n_samples = _frames(duration_ms) * TARGET_CHANNELS
+        if len(samples) > n_samples:
+            samples = samples[:n_samples]
+        elif 0 < len(samples) < n_samples:
+            # For short effects, loop them for natural repetition
+            repetitions = -(-n_samples // len(samples))
+            samples = np.tile(samples, repetitions)[:n_samples]
+        
+        return sfx._spawn(samples.tobytes())
     
     def generate_sfx(self, effect_name, duration_ms=None):
         """Generate sound effect using ElevenLabs API."""
@@ -554,9 +952,10 @@ class SoundEffectsGenerator:
             
         # Check cache first
         cache_key = f"{effect_name}_{duration_ms}"
-        if cache_key in self.sfx_cache:
+        sfx = self._cache_get(cache_key)
+        if sfx is not None:
             logger.info(f"Using cached sound effect: {effect_name}")
-            return self.sfx_cache[cache_key]
+            return sfx
         
         # Get prompt for the effect
         effect_key = effect_name.lower()
@@ -568,7 +967,7 @@ class SoundEffectsGenerator:
         logger.info(f"Generating sound effect '{effect_name}' with prompt: {prompt}")
         
         # Use the text-to-speech API with specific settings optimized for SFX
-        url = f"{ELEVENLABS_SPEECH_API_URL}/21m00Tcm4TlvDq8ikWAM"  # Using Rachel voice for SFX
+        url = f"{ELEVENLABS_SPEECH_API_URL}/21m00Tcm4TlvDq8ikWAM?output_format={self.output_format}"  # Using Rachel voice for SFX
         headers = {
             "Content-Type": "application/json",
             # API key will be added by api_key_manager
@@ -588,6 +987,20 @@ class SoundEffectsGenerator:
             }
         }
         
+        # Reuse the generated effect from a previous run when the request is unchanged
+        disk_key = [url, data]
+        audio_bytes = self.audio_cache.get(disk_key)
+        if audio_bytes is not None:
+            # A damaged entry is dropped and generated again rather than failing the podcast
+            try:
+                sfx = self._process(_decode(audio_bytes, self.output_format), duration_ms)
+                logger.info(f"Using cached sound effect from disk: {effect_name}")
+                self._cache_put(cache_key, sfx)
+                return sfx
+            except Exception as e:
+                logger.warning(f"Discarding undecodable cached sound effect {effect_name}: {str(e)}")
+                self.audio_cache.discard(disk_key)
+        
         try:
             # Make the API request with rotation and retry
             response, api_key = self.api_key_manager.make_api_call(
@@ -597,44 +1010,22 @@ class SoundEffectsGenerator:
             )
             
             if response:
-                # Calculate credit usage
+                self.audio_cache.put(disk_key, response.content)
+                
+                # Use the billed cost reported by the API, falling back to 1 credit per character
                 char_count = len(enhanced_prompt)
-                credits_used = char_count
+                credits_used = self.api_key_manager.character_cost(response, char_count)
                 
                 # Log credit usage
                 self.api_key_manager.log_credit_usage(
                     api_key, char_count, credits_used, "sfx_generation"
                 )
                 
-                # Create temp file for the audio
-                temp_file = os.path.join(
-                    self.temp_dir,
-                    f"sfx_{int(time.time())}_{random.randint(1000, 9999)}.mp3"
-                )
-                
-                with open(temp_file, 'wb') as f:
-                    f.write(response.content)
-                
-                # Load and process the sound effect
-                sfx = AudioSegment.from_mp3(temp_file)
-                
-                # Apply volume reduction
-                sfx = sfx - self.volume_reduction
-                
-                # Clean up temp file
-                os.remove(temp_file)
-                
-                # Adjust duration if needed
-                if len(sfx) > duration_ms:
-                    sfx = sfx[:duration_ms]
-                elif len(sfx) < duration_ms:
-                    # For short effects, loop them for natural repetition
-                    repetitions = duration_ms // len(sfx) + 1
-                    sfx = sfx * repetitions
-                    sfx = sfx[:duration_ms]
+                # Decode the audio in memory and process the sound effect
+                sfx = self._process(_decode(response.content, self.output_format), duration_ms)
                 
                 # Add to cache
-                self.sfx_cache[cache_key] = sfx
+                self._cache_put(cache_key, sfx)
                 
                 logger.info(f"Successfully generated sound effect: {effect_name}")
                 return sfx
@@ -654,8 +1045,14 @@ class PodcastGenerator:
         """Initialize the podcast generator."""
         self.config = config or ConfigManager()
         self.api_key_manager = api_key_manager
-        self.speech_synthesizer = SpeechSynthesizer(api_key_manager, self.config)
-        self.sfx_generator = SoundEffectsGenerator(api_key_manager, self.config)
+        self.voice_settings = VoiceSettings.from_config(self.config)
+        
+        # Guards first use of the lazily built cache and synthesizers
+        self._setup_lock = threading.Lock()
+        
+        # Default output paths handed out so far, so concurrent batch jobs never share one
+        self._output_files = set()
+        self._output_lock = threading.Lock()
         
         # Audio settings
         self.silence_between_chunks = self.config.getint("Audio", "silence_between_chunks", fallback=200)
@@ -663,6 +1060,16 @@ class PodcastGenerator:
         self.normalize_audio = self.config.getboolean("Audio", "normalize_audio", fallback=True)
         self.audio_format = self.config.get("Audio", "format", fallback="mp3")
         self.bit_rate = self.config.get("Audio", "bit_rate", fallback="192k")
+        self.sfx_overlap = self.config.getboolean("SoundEffects", "sfx_overlap", fallback=True)
+        
+        # Silences are just gaps in the zero-filled output buffer, measured in samples
+        self._intro_silence_len = _frames(self.intro_silence) * TARGET_CHANNELS
+        self._dialogue_lead_len = _frames(300) * TARGET_CHANNELS
+        self._chunk_gap_len = _frames(self.silence_between_chunks) * TARGET_CHANNELS
+        
+        # Podcasts longer than this are assembled in a file on disk instead of in memory
+        buffer_max_mb = self.config.getint("General", "buffer_max_mb", fallback=512)
+        self._buffer_max_len = buffer_max_mb * 1024 * 1024 // SAMPLE_WIDTH
         
         # Create output directory if it doesn't exist
         self.output_dir = self.config.get("General", "output_dir", fallback="output")
@@ -670,81 +1077,215 @@ class PodcastGenerator:
             os.makedirs(self.output_dir)
             logger.info(f"Created directory: {self.output_dir}")
     
+    def _default_output_file(self, script_path):
+        """Pick an output path for the script that no other job or existing file uses."""
+        script_name = os.path.splitext(os.path.basename(script_path))[0]
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(self.output_dir, f"{script_name}_{timestamp}")
+        
+        with self._output_lock:
+            output_file = f"{base}.{self.audio_format}"
+            suffix = 2
+            while output_file in self._output_files or os.path.exists(output_file):
+                output_file = f"{base}_{suffix}.{self.audio_format}"
+                suffix += 1
+            self._output_files.add(output_file)
+        
+        return output_file
+    
+    @cached_property
+    def audio_cache(self):
+        """Disk cache shared by both synthesizers, opened on first use."""
+        return AudioCache.from_config(self.config)
+    
+    @cached_property
+    def speech_synthesizer(self):
+        """Speech synthesizer, built on first use."""
+        return SpeechSynthesizer(self.api_key_manager, self.config, self.audio_cache, self.voice_settings)
+    
+    @cached_property
+    def sfx_generator(self):
+        """Sound effects generator, built on first use."""
+        return SoundEffectsGenerator(self.api_key_manager, self.config, self.audio_cache)
+    
+    def _assemble(self, chunks, results):
+        """Lay rendered chunks out in one buffer of podcast samples."""
+        overlap_len = _frames(2000) * TARGET_CHANNELS
+        sfx_overlap = self.sfx_overlap
+        
+        # First pass: place every chunk, recording where its samples go.
+        # Silences need no samples since the buffer starts zero-filled
+        pieces = []
+        overlays = []
+        pos = self._intro_silence_len
+        spill = None
+        
+        for chunk, audio in zip(chunks, results):
+            if audio:
+                samples = np.frombuffer(_conform(audio).raw_data, dtype=np.int16)
+                
+                if chunk["type"] == "dialogue":
+                    # Add a small silence before the dialogue
+                    pos += self._dialogue_lead_len
+                    pieces.append((pos, samples))
+                    pos += len(samples)
+                    
+                elif sfx_overlap and pos > overlap_len:
+                    # Overlap the sound effect with the last two seconds of audio
+                    overlays.append((pos - overlap_len, samples[:overlap_len]))
+                    
+                else:
+                    # Just append the sound effect
+                    pieces.append((pos, samples))
+                    pos += len(samples)
+            
+            # Add a short silence between chunks
+            pos += self._chunk_gap_len
+            
+            # Once the podcast outgrows the memory budget, write placed chunks
+            # out to a temporary file as they arrive rather than holding them
+            if pos > self._buffer_max_len:
+                if spill is None:
+                    spill = tempfile.TemporaryFile(dir=self.output_dir)
+                for offset, samples in pieces:
+                    spill.seek(offset * SAMPLE_WIDTH)
+                    spill.write(samples.tobytes())
+                pieces.clear()
+        
+        # Second pass: copy each chunk into a preallocated buffer, then mix
+        # the overlapping effects in script order. A spilled podcast is
+        # memory-mapped so the OS pages it in and out as needed
+        if spill is None:
+            podcast = np.zeros(pos, dtype=np.int16)
+        else:
+            spill.truncate(pos * SAMPLE_WIDTH)
+            podcast = np.memmap(spill, dtype=np.int16, mode="r+", shape=(pos,))
+        for offset, samples in pieces:
+            podcast[offset:offset + len(samples)] = samples
+        for offset, samples in overlays:
+            _overlay(podcast, samples, offset)
+        
+        return podcast
+    
+    def _normalize(self, samples, headroom=0.1):
+        """Scale the samples so their peak sits headroom dB below full scale."""
+        peak = max(int(samples.max()), -int(samples.min())) if samples.size else 0
+        
+        # A silent podcast can't be normalized
+        if peak == 0:
+            return samples
+        
+        # Rescale in place in one ufunc pass, without a full-length float
+        # intermediate; the target peak keeps it in range
+        target_peak = 32768 * 10 ** (-headroom / 20)
+        return np.multiply(samples, target_peak / peak, out=samples, casting="unsafe")
+    
+    def _export(self, samples, output_file):
+        """Write podcast samples to output_file in the configured format."""
+        raw_data = memoryview(samples).cast("B")
+        
+        if self.audio_format == "wav":
+            # WAV is just a header around the PCM, no encoder needed
+            with wave.open(output_file, 'wb') as f:
+                f.setnchannels(TARGET_CHANNELS)
+                f.setsampwidth(SAMPLE_WIDTH)
+                f.setframerate(TARGET_FRAME_RATE)
+                f.writeframes(raw_data)
+            return
+        
+        # Pipe the PCM straight into ffmpeg, skipping pydub's temporary input file
+        cmd = [
+            AudioSegment.converter, "-y",
+            "-f", "s16le", "-ar", str(TARGET_FRAME_RATE), "-ac", str(TARGET_CHANNELS),
+            "-i", "pipe:0",
+            "-b:a", self.bit_rate
+        ]
+        
+        # Match pydub's export, which forces libvorbis for ogg rather than ffmpeg's default
+        codec = AudioSegment.DEFAULT_CODECS.get(self.audio_format)
+        if codec:
+            cmd += ["-acodec", codec]
+        cmd += ["-f", self.audio_format, output_file]
+        
+        process = subprocess.run(cmd, input=raw_data, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if process.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with code {process.returncode}: "
+                               f"{process.stderr.decode('utf-8', 'replace').strip()}")
+    
     def generate(self, script_path, output_file=None):
         """Generate a podcast from the given script."""
-        # Parse the script
-        parser = ScriptParser(script_path)
-        chunks = parser.parse()
-        
-        if not chunks:
-            logger.error("No valid content in script")
+        # Check the script before setting up synthesizers or making any requests
+        if not os.path.isfile(script_path) or os.path.getsize(script_path) == 0:
+            logger.error(f"Script is missing or empty: {script_path}")
             return False
         
+        # Build the synthesizers once, even when a batch starts several scripts together
+        with self._setup_lock:
+            speech_synthesizer = self.speech_synthesizer
+            sfx_generator = self.sfx_generator
+        
         # Generate default output filename if not provided
         if not output_file:
-            script_name = os.path.basename(script_path).split('.')[0]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = os.path.join(self.output_dir, f"{script_name}_{timestamp}.{self.audio_format}")
-        
-        # Process each chunk
-        podcast = AudioSegment.silent(duration=self.intro_silence)
-        
-        for i, chunk in enumerate(tqdm(chunks, desc="Generating podcast")):
-            if chunk["type"] == "dialogue":
-                # Synthesize speech
-                audio = self.speech_synthesizer.synthesize(
-                    chunk["text"], 
-                    chunk["speaker"]
-                )
-                
-                if audio:
-                    # Add a small silence before the dialogue
-                    podcast += AudioSegment.silent(duration=300)
-                    podcast += audio
-                
-            elif chunk["type"] == "sfx":
-                # Generate sound effect
-                sfx_clip = self.sfx_generator.generate_sfx(chunk["effect"])
+            output_file = self._default_output_file(script_path)
+        
+        # Render every chunk concurrently, keeping each chunk's request key in script order.
+        # Chunks are submitted as the script is parsed, so requests start right away
+        with ThreadPoolExecutor(max_workers=self.api_key_manager.max_workers) as executor:
+            chunks = []
+            keys = []
+            unique_futures = {}
+            for chunk in ScriptParser(script_path).parse_iter():
+                chunks.append(chunk)
                 
-                if sfx_clip:
-                    # Determine how to add the sound effect
-                    if self.config.getboolean("SoundEffects", "sfx_overlap", fallback=True) and len(podcast) > 2000:
-                        # Overlap with previous audio
-                        overlap_point = len(podcast) - 2000
-                        
-                        # Create a new audio segment with original audio
-                        new_segment = podcast[:overlap_point]
-                        
-                        # Create the overlapped section
-                        overlap_segment = podcast[overlap_point:]
-                        
-                        # Ensure sfx_clip is not longer than the section to overlay
-                        if len(sfx_clip) > len(overlap_segment):
-                            sfx_clip = sfx_clip[:len(overlap_segment)]
-                        
-                        # Overlay the sound effect
-                        overlapped = overlap_segment.overlay(sfx_clip)
-                        
-                        # Combine segments
-                        podcast = new_segment + overlapped
-                    else:
-                        # Just append the sound effect
-                        podcast += sfx_clip
+                # Each distinct line or effect is rendered once, however often the script repeats it
+                if chunk["type"] == "dialogue":
+                    key = ("dialogue", chunk["speaker"].lower(), chunk["text"])
+                    if key not in unique_futures:
+                        unique_futures[key] = executor.submit(
+                            speech_synthesizer.synthesize, chunk["text"], chunk["speaker"]
+                        )
+                else:
+                    key = ("sfx", chunk["effect"])
+                    if key not in unique_futures:
+                        unique_futures[key] = executor.submit(sfx_generator.generate_sfx, chunk["effect"])
+                keys.append(key)
             
-            # Add a short silence between chunks
-            podcast += AudioSegment.silent(duration=self.silence_between_chunks)
+            if not chunks:
+                logger.error("No valid content in script")
+                return False
+            
+            # Count requests as they complete, in whatever order the pool finishes them
+            progress = tqdm(total=len(unique_futures), desc="Generating podcast", mininterval=0.5)
+            for future in unique_futures.values():
+                future.add_done_callback(lambda _: progress.update(1))
+            
+            # Drop each rendered chunk after its last use, so placed audio doesn't stay in memory
+            last_use = {key: index for index, key in enumerate(keys)}
+            
+            def _results():
+                """Yield each chunk's audio in script order as it arrives."""
+                for index, key in enumerate(keys):
+                    future = unique_futures[key]
+                    if last_use[key] == index:
+                        del unique_futures[key]
+                    yield future.result()
+            
+            # Lay the chunks out in script order as their audio arrives, so
+            # assembly overlaps with the requests still in flight
+            with progress:
+                samples = self._assemble(chunks, _results())
+        
+        # Persist credit usage and cache accesses for this podcast
+        self.api_key_manager.flush()
+        self.audio_cache.flush()
         
         # Normalize audio levels if configured
         if self.normalize_audio:
-            podcast = normalize(podcast)
+            samples = self._normalize(samples)
         
         # Export the final podcast
         try:
-            podcast.export(
-                output_file, 
-                format=self.audio_format, 
-                bitrate=self.bit_rate
-            )
+            self._export(samples, output_file)
             logger.info(f"Podcast saved to {output_file}")
             return True
         except Exception as e:
@@ -757,7 +1298,7 @@ def main():
     parser = argparse.ArgumentParser(description="Advanced Auto Podcast Generator with ElevenLabs SFX")
     
     # Basic arguments
-    parser.add_argument("-s", "--script", required=True, help="Path to the script file")
+    parser.add_argument("-s", "--script", required=True, nargs="+", help="Path to one or more script files")
     parser.add_argument("-o", "--output", help="Path to save the output file")
     parser.add_argument("-k", "--keys", help="Comma-separated list of ElevenLabs API keys")
     parser.add_argument("-c", "--config", help="Path to custom config file")
@@ -784,6 +1325,9 @@ def main():
     
     args = parser.parse_args()
     
+    if args.output and len(args.script) > 1:
+        parser.error("--output can only be used with a single script")
+    
     try:
         # Initialize configuration
         config = ConfigManager(args.config if args.config else CONFIG_FILE)
@@ -801,13 +1345,28 @@ def main():
         # Initialize podcast generator
         podcast_generator = PodcastGenerator(api_key_manager, config)
         
-        # Generate podcast
-        success = podcast_generator.generate(args.script, args.output)
+        # Generate the podcasts, a few at a time, sharing keys, sessions and caches
+        batch_concurrency = config.getint("General", "batch_concurrency", fallback=3)
+        with ThreadPoolExecutor(max_workers=min(batch_concurrency, len(args.script))) as executor:
+            jobs = [
+                (script, executor.submit(podcast_generator.generate, script, args.output))
+                for script in args.script
+            ]
+        
+        failed = []
+        for script, future in jobs:
+            try:
+                success = future.result()
+            except Exception as e:
+                logger.error(f"Error generating podcast from {script}: {str(e)}")
+                success = False
+            if not success:
+                failed.append(script)
         
-        if success:
+        if not failed:
             logger.info("Podcast generation completed successfully!")
         else:
-            logger.error("Failed to generate podcast")
+            logger.error(f"Failed to generate podcast: {', '.join(failed)}")
             return 1
             
     except Exception as e: